@@ -0,0 +1,16 @@
+import os
+from mock_eonet_server import MockEonetServer
+import pytest
+
+
+"""
+Tests never open windows, so matplotlib uses non-interactive backend
+(set before any test module imports pyplot)
+"""
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+
+@pytest.fixture(scope="session")
+def eonet_url():
+    with MockEonetServer() as server:
+        yield server.url
@@ -0,0 +1,202 @@
+import random
+import threading
+import traceback
+from natural_events_tracker import (
+    EventTracker,
+    GetDataError,
+    OpenImageError,
+    TooManyCatError,
+)
+
+
+"""
+Const variables:
+default scheduler timing in seconds
+"""
+REFRESH_INTERVAL = 600
+JITTER = 0.1
+MAX_BACKOFF = 3600
+
+
+class PrewarmScheduler:
+    """
+    A class to represent a background scheduler which periodically
+    refreshes data from database and pre-renders maps for slider presets
+
+    Attributes
+    ----------
+    presets : ints list
+        numbers of days for which data is pre-warmed
+    interval : float
+        seconds between two succesful refreshes
+    jitter : float
+        part of interval which is randomly added or subtracted from it
+    max_backoff : float
+        maximal number of seconds to wait after failed refreshes
+    render : bool
+        indicates if png maps should be pre-rendered
+    max_points : int
+        maximal number of points of pre-warmed maps, None for no limit
+    failures : int
+        number of refreshes failed in a row
+    """
+
+    def __init__(
+        self,
+        presets,
+        interval=REFRESH_INTERVAL,
+        jitter=JITTER,
+        max_backoff=MAX_BACKOFF,
+        render=True,
+        max_points=None,
+        tracker_factory=EventTracker,
+    ):
+        """
+        Constructs all the necessary attributes objects.
+        tracker_factory is called with number of days and has to
+        return object with EventTracker interface
+        """
+        self.presets = list(presets)
+        self.interval = interval
+        self.jitter = jitter
+        self.max_backoff = max_backoff
+        self.render = render
+        self.max_points = max_points
+        self.failures = 0
+        self._tracker_factory = tracker_factory
+        self._trackers = {}
+        self._coords = {}
+        self._images = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """
+        Starts daemon thread which refreshes data until stop is called
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        """
+        Stops refreshing thread and waits for it at most timeout seconds
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self):
+        """
+        Loop of refreshing thread, it refreshes data and then waits
+        time returned by next_delay. Unexpected errors are printed
+        and counted as failures, so the thread keeps running with backoff
+        """
+        while not self._stop_event.is_set():
+            try:
+                self.refresh()
+            except Exception:
+                traceback.print_exc()
+                self.failures += 1
+            self._stop_event.wait(self.next_delay())
+
+    def next_delay(self):
+        """
+        Returns number of seconds to wait before next refresh.
+        After failures interval is doubled for each failure
+        (but not longer than max_backoff), then jitter is applied
+        """
+        delay = self.interval
+        if self.failures > 0:
+            delay = min(self.interval * 2**self.failures, self.max_backoff)
+        spread = delay * self.jitter
+        return max(0, delay + random.uniform(-spread, spread))
+
+    def refresh(self):
+        """
+        Gets data for every preset using EventTracker, precomputes
+        coords for all categories with and without intensity
+        (simplified to max_points) and
+        renders png maps for them. Warm artifacts are replaced only
+        when all presets were refreshed.
+        Returns True if refresh succeded
+        """
+        trackers, coords, images = {}, {}, {}
+        try:
+            for days in self.presets:
+                try:
+                    tracker = self._tracker_factory(days)
+                except TooManyCatError:
+                    continue
+                trackers[days] = tracker
+                checked_params = [True for _ in tracker.classified_events]
+                for intensify in (False, True):
+                    key = self._key(
+                        tracker, days, checked_params, intensify, self.max_points
+                    )
+                    coords[key] = tracker.get_coords(
+                        checked_params, intensify, max_points=self.max_points
+                    )
+                    if self.render:
+                        images[key] = tracker.create_map(
+                            coords[key], make_png=True, show=False
+                        )
+        except (GetDataError, OpenImageError):
+            self.failures += 1
+            return False
+        with self._lock:
+            self._trackers = trackers
+            self._coords = coords
+            self._images = images
+        self.failures = 0
+        return True
+
+    def _key(self, tracker, days, checked_params, intensify, max_points):
+        """
+        Returns cache key, checked_params are cut to number of
+        tracker's categories because checkboxes without category are ignored
+        """
+        checked_params = tuple(checked_params[: len(tracker.classified_events)])
+        return days, checked_params, intensify, max_points
+
+    def get_tracker(self, days):
+        """
+        Returns pre-warmed EventTracker for number of days
+        or creates new one if there is none
+        """
+        with self._lock:
+            tracker = self._trackers.get(days)
+        if tracker is None:
+            tracker = self._tracker_factory(days)
+        return tracker
+
+    def get_coords(self, tracker, days, checked_params, intensify, max_points=None):
+        """
+        Returns pre-computed coords for parameters of get_coords
+        or computes them using tracker if they are not warm
+        """
+        key = self._key(tracker, days, checked_params, intensify, max_points)
+        with self._lock:
+            coords = self._coords.get(key)
+            if self._trackers.get(days) is not tracker:
+                coords = None
+        if coords is None:
+            coords = tracker.get_coords(
+                checked_params, intensify, max_points=max_points
+            )
+        return coords
+
+    def get_image(self, tracker, days, checked_params, intensify, max_points=None):
+        """
+        Returns pre-rendered png Image for parameters of get_coords
+        or None if it is not warm
+        """
+        key = self._key(tracker, days, checked_params, intensify, max_points)
+        with self._lock:
+            if self._trackers.get(days) is not tracker:
+                return None
+            return self._images.get(key)
@@ -0,0 +1,127 @@
+import json
+from itertools import islice
+import fiona
+import geopandas as gpd
+
+
+"""
+Const variables:
+columns of exported events and coords with their fiona types
+and python types to which values are converted before writing
+(fiona writes null if int is given for float column)
+and number of features given to fiona at once
+"""
+WRITE_CHUNK_SIZE = 10000
+COLUMN_TYPES = {"str": str, "int": int, "float": float}
+EVENT_COLUMNS = [("category", "str"), ("id", "str"), ("value", "float")]
+COORDS_COLUMNS = [("category", "str"), ("value", "float")]
+
+
+def event_features(events):
+    """
+    Takes as parameter list of Events and yields every point of every event
+    as tuple: x-coord, y-coord, dictonary of properties
+    (id is event's id in database, the same for all its points)
+    """
+    for event in events:
+        for x, y, value in zip(event.x, event.y, event.value):
+            yield x, y, {"category": event.category, "id": event.id, "value": value}
+
+
+def coords_features(all_coords):
+    """
+    Takes as parameter dictonary returned by get_coords and yields
+    every point as tuple: x-coord, y-coord, dictonary of properties
+    """
+    for category, coords in all_coords.items():
+        for x, y, value in zip(coords["x"], coords["y"], coords["value"]):
+            yield x, y, {"category": category, "value": value}
+
+
+def write_geojson_seq(features, path):
+    """
+    Writes features one by one to newline-delimited GeoJSON file.
+    Returns number of written features
+    """
+    count = 0
+    with open(path, "w") as file:
+        for x, y, properties in features:
+            feature = {
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [x, y]},
+                "properties": properties,
+            }
+            file.write(json.dumps(feature) + "\n")
+            count += 1
+    return count
+
+
+def convert_properties(properties, columns):
+    """
+    Returns properties with values converted to types of columns,
+    null values are kept
+    """
+    converted = {}
+    for name, column_type in columns:
+        value = properties.get(name)
+        if value is not None:
+            value = COLUMN_TYPES[column_type](value)
+        converted[name] = value
+    return converted
+
+
+def write_flatgeobuf(features, path, columns):
+    """
+    Writes features to FlatGeobuf file with spatial index using fiona
+    (GDAL builds the index when file is closed). Features are taken from
+    generator and written in chunks of WRITE_CHUNK_SIZE, because writing
+    them one by one is several times slower.
+    Returns number of written features
+    """
+    schema = {"geometry": "Point", "properties": dict(columns)}
+    records = (
+        {
+            "geometry": {"type": "Point", "coordinates": (x, y)},
+            "properties": convert_properties(properties, columns),
+        }
+        for x, y, properties in features
+    )
+    count = 0
+    with fiona.open(
+        path,
+        "w",
+        driver="FlatGeobuf",
+        schema=schema,
+        crs="EPSG:4326",
+        SPATIAL_INDEX="YES",
+    ) as file:
+        chunk = list(islice(records, WRITE_CHUNK_SIZE))
+        while chunk:
+            file.writerecords(chunk)
+            count += len(chunk)
+            chunk = list(islice(records, WRITE_CHUNK_SIZE))
+    return count
+
+
+def export(features, path, columns):
+    """
+    Writes features to FlatGeobuf file if path ends with .fgb and
+    to newline-delimited GeoJSON file if it ends with .geojsonl or .geojsons.
+    Raises ValueError for other extensions, because GIS tools open
+    .json and .geojson files as single FeatureCollection.
+    Returns number of written features
+    """
+    if path.endswith(".fgb"):
+        return write_flatgeobuf(features, path, columns)
+    if path.endswith((".geojsonl", ".geojsons")):
+        return write_geojson_seq(features, path)
+    raise ValueError("Export path has to end with .fgb, .geojsonl or .geojsons!")
+
+
+def read_bbox(path, bbox):
+    """
+    Takes as parameters path to exported file and tuple
+    (min x, min y, max x, max y). Returns GeoDataFrame of features
+    inside bbox, FlatGeobuf files are read using their spatial index
+    """
+    return gpd.read_file(path, bbox=bbox)
@@ -0,0 +1,215 @@
+import argparse
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from mock_eonet_server import CATEGORIES, DEFAULT_CATEGORIES
+from natural_events_tracker import EventTracker
+
+
+"""
+Const variables:
+path of mock server script which is run in separate process
+"""
+SERVER_SCRIPT = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "mock_eonet_server.py"
+)
+
+
+class ServerProcess:
+    """
+    A class to represent mock EONET server running in separate process,
+    so its work is not counted in harness latency and memory.
+    Used as context manager which returns server url
+    """
+
+    def __init__(
+        self,
+        event_count=1000,
+        categories=DEFAULT_CATEGORIES,
+        geometry_count=(1, 10),
+        span_days=365,
+        latency=0.0,
+        failure_rate=0.0,
+        seed=0,
+    ):
+        """
+        Constructs command which starts the server with given parameters
+        (see MockEonetServer)
+        """
+        self.command = [
+            sys.executable,
+            SERVER_SCRIPT,
+            "--events",
+            str(event_count),
+            "--categories",
+            *categories,
+            "--geometry",
+            str(geometry_count[0]),
+            str(geometry_count[1]),
+            "--span-days",
+            str(span_days),
+            "--latency",
+            str(latency),
+            "--failure-rate",
+            str(failure_rate),
+            "--seed",
+            str(seed),
+        ]
+        self.process = None
+
+    def __enter__(self):
+        self.process = subprocess.Popen(self.command, stdout=subprocess.PIPE, text=True)
+        url = self.process.stdout.readline().strip()
+        if not url:
+            self.__exit__()
+            raise RuntimeError("Mock server did not start!")
+        return url
+
+    def __exit__(self, *args):
+        self.process.terminate()
+        self.process.wait()
+        self.process.stdout.close()
+
+
+def percentile(values, percent):
+    """
+    Returns value below which given percent of sorted values lies
+    or None for empty list
+    """
+    if not values:
+        return None
+    index = round(percent / 100 * (len(values) - 1))
+    return values[index]
+
+
+def run_once(url, days, intensify, render):
+    """
+    Creates EventTracker from url, gets coords for all categories
+    and if render is True renders png map off-screen (on detached figure,
+    so runs in many threads do not share pyplot state).
+    Returns time of whole run in seconds
+    """
+    start = time.perf_counter()
+    tracker = EventTracker(days, url)
+    checked_params = [True for _ in tracker.classified_events]
+    coords = tracker.get_coords(checked_params, intensify)
+    if render:
+        tracker.create_map(coords, make_png=True, show=False)
+    return time.perf_counter() - start
+
+
+def trace_memory(url, days, intensify, render):
+    """
+    Repeats one run with tracemalloc started. It is not timed, because
+    tracing slows down every allocation several times.
+    Returns peak of memory allocated by Python during the run (bytes)
+    or None if the run failed
+    """
+    tracemalloc.start()
+    try:
+        run_once(url, days, intensify, render)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    except Exception:
+        peak_memory = None
+    finally:
+        tracemalloc.stop()
+    return peak_memory
+
+
+def run_load(url, runs=50, concurrency=4, days=None, intensify=False, render=True):
+    """
+    Runs EventTracker end to end given number of times using
+    given number of threads. Server should run in other process
+    (see ServerProcess), otherwise its work is included in results.
+    Every exception of a run is counted as its failure.
+    Returns dictonary with number of runs and failures, throughput
+    (succesful runs per second), latency percentiles (seconds)
+    and peak of memory allocated by Python in one separate
+    traced run (bytes, see trace_memory)
+    """
+    latencies, failures = [], 0
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = [
+            executor.submit(run_once, url, days, intensify, render)
+            for _ in range(runs)
+        ]
+        for future in futures:
+            try:
+                latencies.append(future.result())
+            except Exception:
+                failures += 1
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "runs": runs,
+        "failures": failures,
+        "throughput": len(latencies) / elapsed,
+        "p50": percentile(latencies, 50),
+        "p90": percentile(latencies, 90),
+        "p99": percentile(latencies, 99),
+        "run_peak_memory": trace_memory(url, days, intensify, render),
+    }
+
+
+def print_report(report):
+    """
+    Prints results returned by run_load
+    """
+    print("Runs: " + str(report["runs"]) + ", failures: " + str(report["failures"]))
+    print("Throughput: " + format(report["throughput"], ".2f") + " runs/s")
+    for name in ["p50", "p90", "p99"]:
+        if report[name] is not None:
+            print(name + " latency: " + format(report[name] * 1000, ".1f") + " ms")
+    if report["run_peak_memory"] is not None:
+        print(
+            "Peak Python memory of one traced run (not timed): "
+            + format(report["run_peak_memory"] / 2**20, ".1f")
+            + " MiB"
+        )
+    print("(server runs in separate process and is not included)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Load test of EventTracker against local mock EONET server"
+    )
+    parser.add_argument("--events", type=int, default=1000)
+    parser.add_argument(
+        "--categories", nargs="+", choices=CATEGORIES, default=DEFAULT_CATEGORIES
+    )
+    parser.add_argument("--geometry", type=int, nargs=2, default=[1, 10])
+    parser.add_argument("--span-days", type=float, default=365)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--days", type=int, default=None)
+    parser.add_argument("--intensify", action="store_true")
+    parser.add_argument("--no-render", action="store_true")
+    args = parser.parse_args()
+
+    with ServerProcess(
+        args.events,
+        args.categories,
+        tuple(args.geometry),
+        args.span_days,
+        args.latency,
+        args.failure_rate,
+        args.seed,
+    ) as url:
+        print_report(
+            run_load(
+                url,
+                args.runs,
+                args.concurrency,
+                args.days,
+                args.intensify,
+                not args.no_render,
+            )
+        )
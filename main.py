@@ -11,20 +11,28 @@ from PyQt5.QtWidgets import (
     QMessageBox,
 )
 from PyQt5.QtCore import Qt
-from natural_events_tracker import EventTracker
+from events_scheduler import PrewarmScheduler
 
 
 """
 Const variables:
-limits for days user can get data
+limits for days user can get data, presets and points limit of
+pre-warmed maps and seconds to wait for scheduler thread on exit
+(it is daemon, so unfinished refresh is dropped)
 """
 MIN_DAYS = 1
 MAX_DAYS = 200
+DEFAULT_DAYS = int((MAX_DAYS - MIN_DAYS) / 2)
+PRESETS = [7, 30, DEFAULT_DAYS]
+MAX_POINTS = 5000
+STOP_TIMEOUT = 1
 
 
 class MyApp(QWidget):
     def __init__(self):
         super().__init__()
+        self.scheduler = PrewarmScheduler(PRESETS, max_points=MAX_POINTS)
+        self.scheduler.start()
         self.initUI()
 
     def initUI(self):
@@ -49,7 +57,7 @@ class MyApp(QWidget):
         self.slider = QSlider(Qt.Horizontal, self)
         self.slider.setMinimum(MIN_DAYS)
         self.slider.setMaximum(MAX_DAYS)
-        self.slider.setValue(int((MAX_DAYS - MIN_DAYS) / 2))
+        self.slider.setValue(DEFAULT_DAYS)
         self.slider.setTickPosition(QSlider.TicksBelow)
         self.slider.setTickInterval(1)
         self.slider.valueChanged.connect(self.update_value)
@@ -99,6 +107,11 @@ class MyApp(QWidget):
 
         self.save_png_box = QCheckBox("Save output to .png", self)
         self.intensity_box = QCheckBox("Intensify close points", self)
+        self.interactive_box = QCheckBox("Interactive zoom", self)
+        self.limit_points_box = QCheckBox(
+            "Limit to " + str(MAX_POINTS) + " points", self
+        )
+        self.limit_points_box.setChecked(True)
 
         """
         Adds 2 horizontal layouts for parameter checkboxes
@@ -127,6 +140,8 @@ class MyApp(QWidget):
         hbox_run_options = QHBoxLayout()
         hbox_run_options.addWidget(self.save_png_box)
         hbox_run_options.addWidget(self.intensity_box)
+        hbox_run_options.addWidget(self.interactive_box)
+        hbox_run_options.addWidget(self.limit_points_box)
 
         """
         Set all Widgets in one vertical layout
@@ -151,29 +166,60 @@ class MyApp(QWidget):
         """
         Method which calls creating map for specific chechboxes
         after pushing plot button If file was save it also shows
-        information about it
+        information about it. Plot is interactive if its checkbox is checked
         """
         checked_params = [param.isChecked() for param in self.params]
-        coords = self.tracker.get_coords(checked_params, self.intensity_box.isChecked())
-        self.tracker.create_map(coords, False, self.save_png_box.isChecked())
+        coords = self.scheduler.get_coords(
+            self.tracker,
+            self.days,
+            checked_params,
+            self.intensity_box.isChecked(),
+            self.max_points(),
+        )
+        self.tracker.create_map(
+            coords,
+            False,
+            self.save_png_box.isChecked(),
+            interactive=self.interactive_box.isChecked(),
+        )
         if self.save_png_box.isChecked():
             QMessageBox.about(None, "Saved!", "Saved file in current folder ")
 
     def run_function_png(self):
         """
         Method which calls creating map for specific chechboxes after pushing
-        png button. If file was save it also shows information about it
+        png button. If file was save it also shows information about it.
+        Pre-rendered image is shown if scheduler has it
         """
         checked_params = [param.isChecked() for param in self.params]
-        coords = self.tracker.get_coords(checked_params, self.intensity_box.isChecked())
-        self.tracker.create_map(coords, True, self.save_png_box.isChecked())
+        image = self.scheduler.get_image(
+            self.tracker,
+            self.days,
+            checked_params,
+            self.intensity_box.isChecked(),
+            self.max_points(),
+        )
+        if image is not None:
+            if self.save_png_box.isChecked():
+                image.save("natural_events.png")
+            image.show()
+        else:
+            coords = self.scheduler.get_coords(
+                self.tracker,
+                self.days,
+                checked_params,
+                self.intensity_box.isChecked(),
+                self.max_points(),
+            )
+            self.tracker.create_map(coords, True, self.save_png_box.isChecked())
         if self.save_png_box.isChecked():
             QMessageBox.about(None, "Saved!", "Saved file in current folder ")
 
     def run_events_button(self):
         """
         Method which update text in the button when push.
-        Then creates EventTracker object and create get list of event categories
+        Then gets EventTracker object from scheduler (pre-warmed if possible)
+        and create get list of event categories
         Then mark specific checkboxes and makes them visible
         Also activates creating Image button if at least one category is available
         """
@@ -181,7 +227,8 @@ class MyApp(QWidget):
         prev_text = self.events_button.text()
         new_text = prev_text.replace("Find", "Found")
         self.events_button.setText(new_text)
-        self.tracker = EventTracker((self.slider.value()))
+        self.days = self.slider.value()
+        self.tracker = self.scheduler.get_tracker(self.days)
         events_list = list(self.tracker.classified_events.keys())
         for i in range(len(self.params)):
             if i < len(events_list):
@@ -203,6 +250,14 @@ class MyApp(QWidget):
             self.button_see_plot.setDisabled(False)
             self.button_see_png.setDisabled(False)
 
+    def max_points(self):
+        """
+        Returns maximal number of points on map or None if it is not limited
+        """
+        if self.limit_points_box.isChecked():
+            return MAX_POINTS
+        return None
+
     def update_value(self):
         """
         Method which update text in the button when changing slider value
@@ -214,4 +269,6 @@ class MyApp(QWidget):
 if __name__ == "__main__":
     app = QApplication(sys.argv)
     ex = MyApp()
-    sys.exit(app.exec_())
+    exit_code = app.exec_()
+    ex.scheduler.stop(STOP_TIMEOUT)
+    sys.exit(exit_code)
@@ -0,0 +1,273 @@
+import argparse
+import json
+import random
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+"""
+Const variables:
+path of events endpoint, categories with their titles and magnitude units
+and default parameters of synthetic feed
+"""
+EVENTS_PATH = "/api/v3/events"
+CATEGORIES = {
+    "drought": ("Drought", None),
+    "dustHaze": ("Dust and Haze", None),
+    "earthquakes": ("Earthquakes", None),
+    "floods": ("Floods", None),
+    "landslides": ("Landslides", None),
+    "manmade": ("Manmade", None),
+    "seaLakeIce": ("Sea and Lake Ice", "NM^2"),
+    "severeStorms": ("Severe Storms", "kts"),
+    "snow": ("Snow", None),
+    "tempExtremes": ("Temperature Extremes", None),
+    "volcanoes": ("Volcanoes", None),
+    "waterColor": ("Water Color", None),
+    "wildfires": ("Wildfires", "acres"),
+}
+DEFAULT_CATEGORIES = ["wildfires", "severeStorms", "volcanoes", "seaLakeIce", "floods"]
+DATE_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+class MockEonetServer:
+    """
+    A class to represent local server which imitates EONET v3 events endpoint
+    and serves synthetic events
+
+    Attributes
+    ----------
+    events : list
+        contains synthetic events in EONET v3 format
+    latency : float
+        seconds of delay before each response
+    failure_rate : float
+        probability that response is an error
+    url : str
+        address of events endpoint, available after start
+    """
+
+    def __init__(
+        self,
+        event_count=100,
+        categories=DEFAULT_CATEGORIES,
+        geometry_count=(1, 10),
+        span_days=365,
+        latency=0.0,
+        failure_rate=0.0,
+        seed=0,
+        port=0,
+    ):
+        """
+        Constructs all the necessary attributes objects by calling methods.
+        geometry_count is (min, max) number of geometry points of one event,
+        span_days is number of days before now in which events happened
+        and port 0 means any free port
+        """
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.events = self.create_events(
+            event_count, categories, geometry_count, span_days
+        )
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), self.make_handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return "http://" + host + ":" + str(port) + EVENTS_PATH
+
+    def create_events(self, event_count, categories, geometry_count, span_days):
+        """
+        Creates list of synthetic events, each event is random walk
+        of geometry points which dates are one day after another
+        """
+        now = datetime.now(timezone.utc).replace(microsecond=0)
+        events = []
+        for i in range(event_count):
+            category = categories[i % len(categories)]
+            title, unit = CATEGORIES[category]
+            count = self._random.randint(*geometry_count)
+            date = now - timedelta(days=self._random.uniform(0, span_days))
+            x = self._random.uniform(-180, 180)
+            y = self._random.uniform(-80, 80)
+            geometry = []
+            for _ in range(count):
+                magnitude = None
+                if unit is not None:
+                    magnitude = round(self._random.uniform(10, 1000), 2)
+                geometry.append(
+                    {
+                        "magnitudeValue": magnitude,
+                        "magnitudeUnit": unit,
+                        "date": min(date, now).strftime(DATE_FORMAT),
+                        "type": "Point",
+                        "coordinates": [round(x, 4), round(y, 4)],
+                    }
+                )
+                date += timedelta(days=1)
+                x = max(-180, min(180, x + self._random.uniform(-2, 2)))
+                y = max(-90, min(90, y + self._random.uniform(-2, 2)))
+            events.append(
+                {
+                    "id": "EONET_" + str(i),
+                    "title": title + " " + str(i),
+                    "description": None,
+                    "link": EVENTS_PATH + "/EONET_" + str(i),
+                    "closed": None,
+                    "categories": [{"id": category, "title": title}],
+                    "sources": [],
+                    "geometry": geometry,
+                }
+            )
+        return events
+
+    def filter_events(self, query):
+        """
+        Takes as parameter dictonary of query parameters and returns events
+        which match category and have geometry in time given by days
+        or by start and end dates
+        """
+        start, end = None, None
+        if "days" in query:
+            end = datetime.now(timezone.utc)
+            start = end - timedelta(days=int(query["days"][0]))
+        if "start" in query:
+            start = datetime.strptime(query["start"][0], "%Y-%m-%d")
+            start = start.replace(tzinfo=timezone.utc)
+        if "end" in query:
+            end = datetime.strptime(query["end"][0], "%Y-%m-%d")
+            end = end.replace(tzinfo=timezone.utc) + timedelta(days=1)
+        categories = None
+        if "category" in query:
+            categories = set(query["category"][0].split(","))
+
+        events = []
+        for event in self.events:
+            if categories is not None:
+                if event["categories"][0]["id"] not in categories:
+                    continue
+            if start is not None or end is not None:
+                dates = [
+                    datetime.strptime(geo["date"], DATE_FORMAT).replace(
+                        tzinfo=timezone.utc
+                    )
+                    for geo in event["geometry"]
+                ]
+                if not any(
+                    (start is None or date >= start) and (end is None or date < end)
+                    for date in dates
+                ):
+                    continue
+            events.append(event)
+        return events
+
+    def make_handler(self):
+        """
+        Returns request handler class which uses this server's events
+        """
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if server.latency:
+                    time.sleep(server.latency)
+                parsed = urlparse(self.path)
+                with server._lock:
+                    failed = server._random.random() < server.failure_rate
+                if parsed.path.rstrip("/") != EVENTS_PATH:
+                    self.send(404, b"Not found")
+                elif failed:
+                    self.send(503, b"Service unavailable")
+                else:
+                    try:
+                        events = server.filter_events(parse_qs(parsed.query))
+                    except ValueError:
+                        self.send(400, b"Bad request")
+                        return
+                    body = {
+                        "title": "EONET Events",
+                        "description": "Natural events from EONET.",
+                        "link": server.url,
+                        "events": events,
+                    }
+                    self.send(200, json.dumps(body).encode(), "application/json")
+
+            def send(self, code, body, content_type="text/plain"):
+                self.send_response(code)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def serve_forever(self):
+        """
+        Serves requests in current thread until process is stopped
+        """
+        self._server.serve_forever()
+
+    def start(self):
+        """
+        Starts serving requests in daemon thread
+        """
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """
+        Stops serving requests and closes the socket
+        """
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local mock EONET v3 server")
+    parser.add_argument("--events", type=int, default=100)
+    parser.add_argument(
+        "--categories", nargs="+", choices=CATEGORIES, default=DEFAULT_CATEGORIES
+    )
+    parser.add_argument("--geometry", type=int, nargs=2, default=[1, 10])
+    parser.add_argument("--span-days", type=float, default=365)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--port", type=int, default=0)
+    args = parser.parse_args()
+
+    server = MockEonetServer(
+        event_count=args.events,
+        categories=args.categories,
+        geometry_count=tuple(args.geometry),
+        span_days=args.span_days,
+        latency=args.latency,
+        failure_rate=args.failure_rate,
+        seed=args.seed,
+        port=args.port,
+    )
+    print(server.url, flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
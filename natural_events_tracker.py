@@ -1,9 +1,22 @@
 import requests
 from matplotlib import pyplot as plt
+from matplotlib.collections import PatchCollection
+from matplotlib.figure import Figure
+from matplotlib.patches import PathPatch
+from matplotlib.path import Path
 import geopandas as gpd
-import pandas as pd
+import numpy as np
 import io
 from PIL import Image, ImageFont, ImageDraw
+from track_simplification import simplify_events
+from viewport import ViewportPlotter
+from exporters import (
+    COORDS_COLUMNS,
+    EVENT_COLUMNS,
+    coords_features,
+    event_features,
+    export,
+)
 
 
 """
@@ -59,14 +72,17 @@ class Event:
     value : floats list
         represent magnitude values of event
         could also have null values
+    id : str
+        represent event's id in database, None if unknown
 
     """
 
-    def __init__(self, category, x, y, value):
+    def __init__(self, category, x, y, value, event_id=None):
         self._category = category
         self._x = x
         self._y = y
         self._value = value
+        self._id = event_id
 
     @property
     def x(self):
@@ -100,6 +116,14 @@ class Event:
     def category(self, val):
         self._category = val
 
+    @property
+    def id(self):
+        return self._id
+
+    @id.setter
+    def id(self, val):
+        self._id = val
+
 
 class EventTracker:
     """
@@ -107,18 +131,25 @@ class EventTracker:
 
     Attributes
     ----------
+    url :
+        address of events endpoint of database
     events :
         contains list of Events objects
     classified_events :
         contains dictonary of Events based on category
+    viewport :
+        ViewportPlotter of last interactive plot
     """
 
-    def __init__(self, days=None):
+    def __init__(self, days=None, url=MAIN_URL):
         """
         Constructs all the necessary attributes objects by calling methods.
+        url is address of events endpoint of database
         """
+        self.url = url
         self.events = self.get_events(days)
         self.classified_events = self.get_classified_events()
+        self.viewport = None
 
     def get_events(self, days=None):
         """
@@ -127,7 +158,7 @@ class EventTracker:
 
         returns list of Events objects
         """
-        url = MAIN_URL
+        url = self.url
         if days is not None:
             url += "?days=" + str(days)
         data = self.get_data(url)
@@ -159,7 +190,9 @@ class EventTracker:
                 x.append(geo["coordinates"][0])
                 y.append(geo["coordinates"][1])
                 value.append(geo["magnitudeValue"])
-            creted_event = Event(event["categories"][0]["id"], x, y, value)
+            creted_event = Event(
+                event["categories"][0]["id"], x, y, value, event["id"]
+            )
             events.append(creted_event)
         return events
 
@@ -275,13 +308,15 @@ class EventTracker:
                 normalised_values.append(250)
         return normalised_values
 
-    def get_coords(self, checked_params, intensify):
+    def get_coords(self, checked_params, intensify, tolerance=None, max_points=None):
         """
         Takes as parameters boolean list which indicates event categories that
         should be on plot and boolean value intensify
         which indicates if close points should be connected.
+        Optional tolerance (in degrees) and max_points (for all categories
+        together) make event tracks simplified before they are used.
         Method for each event category (which was True in boolean list)
-        iterates through coordinates in all events and
+        calls get_checked_events and iterates through coordinates in all events and
         adds all features: x-coords, y-coords, point-value to lists.
         Then calls normalise_events_values method which makes all values
         for points appropriate.
@@ -290,17 +325,14 @@ class EventTracker:
         lists of points features
         """
         all_coords = {}
-        j = -1
-        for category in self.classified_events.keys():
-            j += 1
-            if not checked_params[j]:
-                continue
+        checked_events = self.get_checked_events(checked_params, tolerance, max_points)
+        for category, events in checked_events.items():
             single_category_geometries = {}
             x_list = []
             y_list = []
             value_list = []
 
-            for event in self.classified_events[category]:
+            for event in events:
                 for x, y, value in zip(event.x, event.y, event.value):
                     x_list.append(x)
                     y_list.append(y)
@@ -318,6 +350,46 @@ class EventTracker:
             all_coords[category] = single_category_geometries
         return all_coords
 
+    def get_checked_events(self, checked_params, tolerance=None, max_points=None):
+        """
+        Takes as parameters boolean list which indicates event categories that
+        should be on plot, tolerance and maximal number of points.
+        If tolerance or max_points is given events tracks are simplified
+        using simplify_events (which can also merge events).
+        It returns dictonary of events for checked categories
+        """
+        checked_events = {}
+        j = -1
+        for category in self.classified_events.keys():
+            j += 1
+            if checked_params[j]:
+                checked_events[category] = self.classified_events[category]
+
+        if tolerance is None and max_points is None:
+            return checked_events
+
+        events = [event for events in checked_events.values() for event in events]
+        simplified_events = {category: [] for category in checked_events}
+        for event in simplify_events(events, tolerance, max_points):
+            simplified_events[event.category].append(event)
+        return simplified_events
+
+    def export_events(self, path):
+        """
+        Writes points of all events to FlatGeobuf (.fgb) or
+        newline-delimited GeoJSON (.geojsonl or .geojsons) file.
+        Returns number of written points
+        """
+        return export(event_features(self.events), path, EVENT_COLUMNS)
+
+    def export_coords(self, all_coords, path):
+        """
+        Writes points returned by get_coords to FlatGeobuf (.fgb) or
+        newline-delimited GeoJSON (.geojsonl or .geojsons) file.
+        Returns number of written points
+        """
+        return export(coords_features(all_coords), path, COORDS_COLUMNS)
+
     def add_legend(self, background, map_width, map_height, event_types):
         """
         parameters:
@@ -336,7 +408,7 @@ class EventTracker:
         for i in range(len(event_types)):
             caption = event_types[i]
             font = ImageFont.truetype(font="fonts/arial.ttf", size=30)
-            w, h = font.getsize(caption)
+            _, _, w, h = font.getbbox(caption)
             draw = ImageDraw.Draw(background)
             text_position_coeff = (i - (int)(len(event_types) / 2)) / len(event_types)
             draw.text(
@@ -349,18 +421,25 @@ class EventTracker:
                 fill=COLORS[i],
             )
 
-    def open_as_image(self, all_coords, save):
+    def open_as_image(self, all_coords, save, show=True, figure=None):
         """
         parameters:
         Dictonary which contains points parameters sorted by category
 
         Boolean save which indicates if we save output to .png file
 
+        Boolean show which indicates if the image is shown to user
+
+        Figure from which image is made, current pyplot figure if None
+
         Method creates empty image using PIL, pastes plot to it and adds
-        legend to the plot. Can also save the image, then shows it for user
+        legend to the plot. Can also save the image, then shows it for user.
+        Returns created image
         """
+        if figure is None:
+            figure = plt.gcf()
         img_buf = io.BytesIO()
-        plt.savefig(img_buf, format="png")
+        figure.savefig(img_buf, format="png")
         try:
             im = Image.open(img_buf)
             map_width, map_height = im.size
@@ -371,9 +450,13 @@ class EventTracker:
             raise OpenImageError()
         if save:
             background.save("natural_events.png")
-        background.show()
+        if show:
+            background.show()
+        return background
 
-    def create_map(self, all_coords, make_png=False, save=False):
+    def create_map(
+        self, all_coords, make_png=False, save=False, show=True, interactive=False
+    ):
         """
         parameters:
 
@@ -386,60 +469,92 @@ class EventTracker:
 
         Boolean save which indicates if we save output to .png file
 
+        Boolean show which indicates if result is shown to user.
+        If False map is rendered off-screen without pyplot, so it
+        can be safely called from background thread
+
+        Boolean interactive which indicates if plot draws only points
+        inside current viewport (with less details when zoomed out)
+
         Method close all active figures, calls methods to create world max,
         add points to plot and base on parameters creates plot
         with adding legend and showing the plot)
-        or png image and saves it or not
+        or png image and saves it or not.
+        Returns png Image or None for plot
         """
-        plt.close()
-        ax = self.create_empty_map()
-        self.add_points_to_plot(ax, all_coords)
+        if show:
+            plt.close()
+        ax = self.create_empty_map(detached=not show)
+        if interactive and not make_png:
+            self.viewport = ViewportPlotter(ax, all_coords, COLORS)
+        else:
+            self.add_points_to_plot(ax, all_coords)
 
         if make_png:
-            self.open_as_image(all_coords, save)
-        else:
-            plt.legend(
-                loc="lower center",
-                bbox_to_anchor=(0.5, -0.1),
-                fancybox=True,
-                shadow=True,
-                ncol=8,
-            )
-            if save:
-                plt.savefig("natural_events.png")
+            return self.open_as_image(all_coords, save, show, ax.figure)
+        ax.legend(
+            loc="lower center",
+            bbox_to_anchor=(0.5, -0.1),
+            fancybox=True,
+            shadow=True,
+            ncol=8,
+        )
+        if save:
+            ax.figure.savefig("natural_events.png")
+        if show:
             plt.show()
 
-    def create_empty_map(self):
+    def create_empty_map(self, detached=False):
         """
-        Creates empty world map ussing geopandas dataset
-        and returns ax of this plot
+        Creates empty world map ussing dataset returned by load_world
+        and returns ax of this plot.
+        If detached is True figure is not managed by pyplot
         """
-        world = gpd.read_file(gpd.datasets.get_path("naturalearth_lowres"))
-        fig, ax = plt.subplots(figsize=(20, 10))
-        world.plot(ax=ax)
+        world = self.load_world()
+        if detached:
+            fig = Figure(figsize=(20, 10))
+            ax = fig.subplots()
+        else:
+            fig, ax = plt.subplots(figsize=(20, 10))
+        self.plot_world(ax, world)
         return ax
 
+    def plot_world(self, ax, world):
+        """
+        Adds polygons of world countries to ax as one collection.
+        GeoDataFrame.plot is not used because it calls plt.draw,
+        which touches pyplot figures also for detached ax
+        """
+        patches = []
+        for polygon in world.geometry.explode(index_parts=False):
+            path = Path.make_compound_path(
+                Path(np.asarray(polygon.exterior.coords)[:, :2]),
+                *[Path(np.asarray(ring.coords)[:, :2]) for ring in polygon.interiors],
+            )
+            patches.append(PathPatch(path))
+        ax.add_collection(PatchCollection(patches), autolim=True)
+        ax.autoscale_view()
+        ax.set_aspect("equal")
+
+    def load_world(self):
+        """
+        Returns GeoDataFrame with world countries from geopandas dataset
+        """
+        return gpd.read_file(gpd.datasets.get_path("naturalearth_lowres"))
+
     def add_points_to_plot(self, ax, all_coords):
         """
-        Iterates through categories of events and makes DataFrame for each of
-        them which then transform into GeoDataFrame and adds it as series of
-        data to the chart
+        Iterates through categories of events and adds points of each
+        of them as series of data to the chart
         """
         i = 0
         for category_name, category in all_coords.items():
-            df = pd.DataFrame(
-                {
-                    "x": category["x"],
-                    "y": category["y"],
-                    "size": category["value"],
-                }
-            )
-            gdf = gpd.GeoDataFrame(df, geometry=gpd.points_from_xy(df.x, df.y))
-            gdf.plot(
-                ax=ax,
+            ax.scatter(
+                category["x"],
+                category["y"],
+                s=category["value"],
                 marker="o",
                 color=COLORS[i],
-                markersize="size",
                 alpha=1.0,
                 label=category_name,
             )
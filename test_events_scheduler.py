@@ -0,0 +1,127 @@
+import time
+from events_scheduler import PrewarmScheduler
+from matplotlib import pyplot as plt
+from natural_events_tracker import EventTracker, GetDataError
+from PIL import Image
+
+
+class FakeTracker:
+    def __init__(self, days):
+        self.days = days
+        self.classified_events = {"wildfires": [], "volcanoes": []}
+        self.coords_calls = 0
+
+    def get_coords(self, checked_params, intensify, max_points=None):
+        self.coords_calls += 1
+        return {"days": self.days, "intensify": intensify}
+
+    def create_map(self, all_coords, make_png=False, save=False, show=True):
+        return ("image", all_coords["days"], all_coords["intensify"])
+
+
+def failing_factory(days):
+    raise GetDataError()
+
+
+def broken_factory(days):
+    raise RuntimeError("unexpected")
+
+
+def wait_for(condition, timeout=30):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_refresh_prewarms_presets():
+    scheduler = PrewarmScheduler([7, 30], tracker_factory=FakeTracker)
+    assert scheduler.refresh()
+    tracker = scheduler.get_tracker(30)
+    assert tracker.days == 30
+    checked_params = [True, True, False, False, False, False, False, False]
+    coords = scheduler.get_coords(tracker, 30, checked_params, True)
+    assert coords == {"days": 30, "intensify": True}
+    assert tracker.coords_calls == 2
+    assert scheduler.get_image(tracker, 30, checked_params, False) == (
+        "image",
+        30,
+        False,
+    )
+
+
+def test_max_points_is_part_of_warm_key():
+    scheduler = PrewarmScheduler([7], max_points=100, tracker_factory=FakeTracker)
+    scheduler.refresh()
+    tracker = scheduler.get_tracker(7)
+    assert scheduler.get_image(tracker, 7, [True, True], False, 100) is not None
+    assert scheduler.get_image(tracker, 7, [True, True], False) is None
+
+
+def test_get_coords_miss_computes_on_demand():
+    scheduler = PrewarmScheduler([7], tracker_factory=FakeTracker)
+    scheduler.refresh()
+    tracker = scheduler.get_tracker(15)
+    assert scheduler.get_image(tracker, 15, [True, True], False) is None
+    assert scheduler.get_coords(tracker, 15, [True, False], False)["days"] == 15
+    assert tracker.coords_calls == 1
+
+
+def test_failed_refresh_keeps_warm_data():
+    scheduler = PrewarmScheduler([7], tracker_factory=FakeTracker)
+    scheduler.refresh()
+    tracker = scheduler.get_tracker(7)
+    scheduler._tracker_factory = failing_factory
+    assert not scheduler.refresh()
+    assert scheduler.failures == 1
+    assert scheduler.get_tracker(7) is tracker
+
+
+def test_next_delay_backoff_and_jitter():
+    scheduler = PrewarmScheduler([], interval=10, jitter=0.1, max_backoff=35)
+    assert 9 <= scheduler.next_delay() <= 11
+    scheduler.failures = 1
+    assert 18 <= scheduler.next_delay() <= 22
+    scheduler.failures = 5
+    assert 31.5 <= scheduler.next_delay() <= 38.5
+
+
+def test_thread_refreshes_until_stopped():
+    scheduler = PrewarmScheduler([7], interval=0.01, tracker_factory=FakeTracker)
+    scheduler.start()
+    first = scheduler._thread
+    assert wait_for(lambda: 7 in scheduler._trackers)
+    tracker = scheduler._trackers[7]
+    assert wait_for(lambda: scheduler._trackers[7] is not tracker)
+    scheduler.stop(timeout=5)
+    assert not first.is_alive()
+    assert scheduler._thread is None
+
+
+def test_thread_survives_unexpected_errors():
+    scheduler = PrewarmScheduler(
+        [7], interval=0.01, max_backoff=0.02, tracker_factory=broken_factory
+    )
+    scheduler.start()
+    assert wait_for(lambda: scheduler.failures >= 2)
+    assert scheduler._thread.is_alive()
+    scheduler._tracker_factory = FakeTracker
+    assert wait_for(lambda: 7 in scheduler._trackers)
+    assert scheduler.failures == 0
+    scheduler.stop(timeout=5)
+
+
+def test_thread_renders_maps_off_screen(eonet_url):
+    plt.close("all")
+    scheduler = PrewarmScheduler(
+        [30], tracker_factory=lambda days: EventTracker(days, eonet_url)
+    )
+    scheduler.start()
+    assert wait_for(lambda: 30 in scheduler._trackers)
+    scheduler.stop(timeout=5)
+    tracker = scheduler.get_tracker(30)
+    checked_params = [True for _ in tracker.classified_events]
+    image = scheduler.get_image(tracker, 30, checked_params, False)
+    assert isinstance(image, Image.Image)
+    assert image.size[1] > 100
+    assert plt.get_fignums() == []
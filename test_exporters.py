@@ -0,0 +1,87 @@
+import exporters
+import json
+import random
+from exporters import (
+    COORDS_COLUMNS,
+    EVENT_COLUMNS,
+    coords_features,
+    event_features,
+    export,
+    read_bbox,
+    write_flatgeobuf,
+    write_geojson_seq,
+)
+from natural_events_tracker import Event
+import pytest
+
+
+def event_id(i):
+    return "EONET_" + str(i)
+
+
+def random_features(count):
+    generator = random.Random(0)
+    for i in range(count):
+        x = generator.uniform(-180, 180)
+        y = generator.uniform(-90, 90)
+        value = generator.choice([None, 20.0, 250.0])
+        yield x, y, {"category": "wildfires", "id": event_id(i), "value": value}
+
+
+def test_event_features():
+    events = [Event("volcanoes", [1, 2], [3, 4], [None, 5.0], "EONET_7")]
+    assert list(event_features(events)) == [
+        (1, 3, {"category": "volcanoes", "id": "EONET_7", "value": None}),
+        (2, 4, {"category": "volcanoes", "id": "EONET_7", "value": 5.0}),
+    ]
+
+
+def test_write_geojson_seq(tmp_path):
+    path = str(tmp_path / "coords.geojsonl")
+    all_coords = {"floods": {"x": [1, 2], "y": [3, 4], "value": [20, 250]}}
+    assert write_geojson_seq(coords_features(all_coords), path) == 2
+    with open(path) as file:
+        features = [json.loads(line) for line in file]
+    assert features[1]["geometry"]["coordinates"] == [2, 4]
+    assert features[1]["properties"] == {"category": "floods", "value": 250}
+
+
+def test_write_flatgeobuf_reads_all(tmp_path, monkeypatch):
+    monkeypatch.setattr(exporters, "WRITE_CHUNK_SIZE", 64)
+    path = str(tmp_path / "events.fgb")
+    assert write_flatgeobuf(random_features(500), path, EVENT_COLUMNS) == 500
+    gdf = read_bbox(path, (-180, -90, 180, 90))
+    assert len(gdf) == 500
+    assert sorted(gdf["id"]) == sorted(event_id(i) for i in range(500))
+    assert gdf.crs.to_epsg() == 4326
+
+
+def test_write_flatgeobuf_bbox_uses_index(tmp_path):
+    path = str(tmp_path / "events.fgb")
+    write_flatgeobuf(random_features(500), path, EVENT_COLUMNS)
+    expected = [
+        properties["id"]
+        for x, y, properties in random_features(500)
+        if 0 <= x <= 40 and 0 <= y <= 40
+    ]
+    assert sorted(read_bbox(path, (0, 0, 40, 40))["id"]) == sorted(expected)
+
+
+def test_write_flatgeobuf_empty(tmp_path):
+    path = str(tmp_path / "coords.fgb")
+    assert write_flatgeobuf(iter([]), path, COORDS_COLUMNS) == 0
+    assert len(read_bbox(path, (-180, -90, 180, 90))) == 0
+
+
+def test_export_chooses_format_by_extension(tmp_path):
+    all_coords = {"floods": {"x": [1, 2], "y": [3, 4], "value": [20, 250]}}
+    fgb_path = str(tmp_path / "coords.fgb")
+    assert export(coords_features(all_coords), fgb_path, COORDS_COLUMNS) == 2
+    gdf = read_bbox(fgb_path, (0, 0, 1.5, 3.5))
+    assert list(gdf["category"]) == ["floods"]
+    assert list(gdf["value"]) == [20]
+    json_path = str(tmp_path / "coords.geojsonl")
+    assert export(coords_features(all_coords), json_path, COORDS_COLUMNS) == 2
+    assert len(read_bbox(json_path, (0, 0, 1.5, 3.5))) == 1
+    with pytest.raises(ValueError):
+        export(coords_features(all_coords), str(tmp_path / "coords.geojson"), [])
@@ -0,0 +1,101 @@
+from datetime import datetime, timedelta, timezone
+import load_harness
+from load_harness import ServerProcess, run_load
+from matplotlib import pyplot as plt
+from mock_eonet_server import MockEonetServer
+from natural_events_tracker import EventTracker, GetDataError
+import pytest
+import requests
+
+
+def test_server_serves_configured_events():
+    with MockEonetServer(event_count=20, geometry_count=(3, 3)) as server:
+        data = requests.get(server.url).json()
+    assert len(data["events"]) == 20
+    assert all(len(event["geometry"]) == 3 for event in data["events"])
+
+
+def test_server_filters_category_and_days():
+    with MockEonetServer(event_count=50, span_days=100) as server:
+        data = requests.get(server.url + "?category=wildfires,volcanoes").json()
+        recent = requests.get(server.url + "?days=10").json()
+    categories = {event["categories"][0]["id"] for event in data["events"]}
+    assert categories == {"wildfires", "volcanoes"}
+    assert 0 < len(recent["events"]) < 50
+
+
+def test_server_filters_start_and_end():
+    end = datetime.now(timezone.utc) - timedelta(days=40)
+    start = end - timedelta(days=10)
+    query = "?start=" + start.strftime("%Y-%m-%d") + "&end=" + end.strftime("%Y-%m-%d")
+    window_start = start.strftime("%Y-%m-%d")
+    window_end = end.strftime("%Y-%m-%d")
+    with MockEonetServer(event_count=60, span_days=100) as server:
+        data = requests.get(server.url + query).json()
+        all_events = server.events
+    included = {event["id"] for event in data["events"]}
+    expected = set()
+    for event in all_events:
+        dates = [geo["date"][:10] for geo in event["geometry"]]
+        if any(window_start <= date <= window_end for date in dates):
+            expected.add(event["id"])
+    assert 0 < len(included) < len(all_events)
+    assert included == expected
+    for event in all_events:
+        dates = [geo["date"][:10] for geo in event["geometry"]]
+        if event["id"] not in included:
+            assert all(date < window_start or date > window_end for date in dates)
+
+    old_end = datetime.now(timezone.utc) - timedelta(days=400)
+    old_query = "?end=" + old_end.strftime("%Y-%m-%d")
+    with MockEonetServer(event_count=30, span_days=100) as server:
+        assert requests.get(server.url + old_query).json()["events"] == []
+
+
+def test_server_failures_raise_get_data_error():
+    with MockEonetServer(failure_rate=1.0) as server:
+        with pytest.raises(GetDataError):
+            EventTracker(url=server.url)
+
+
+def test_run_load_reports_results():
+    plt.close("all")
+    with ServerProcess(event_count=30) as url:
+        report = run_load(url, runs=4, concurrency=2)
+    assert report["runs"] == 4
+    assert report["failures"] == 0
+    assert report["throughput"] > 0
+    assert report["p50"] <= report["p99"]
+    assert report["run_peak_memory"] > 0
+    assert plt.get_fignums() == []
+
+
+def test_run_load_counts_unexpected_errors(monkeypatch):
+    def run_once(url, days, intensify, render):
+        if days == 2:
+            raise ValueError("unexpected")
+        return 0.1
+
+    monkeypatch.setattr(load_harness, "run_once", run_once)
+    report = run_load("url", runs=3, concurrency=2, days=2)
+    assert report["failures"] == 3
+    assert report["p50"] is None
+    assert report["run_peak_memory"] is None
+    assert run_load("url", runs=3, days=1)["failures"] == 0
+
+
+def test_server_process_passes_feed_options():
+    with ServerProcess(
+        event_count=40, categories=["floods", "snow"], span_days=5, seed=3
+    ) as url:
+        data = requests.get(url).json()
+        recent = requests.get(url + "?days=10").json()
+    categories = {event["categories"][0]["id"] for event in data["events"]}
+    assert categories == {"floods", "snow"}
+    assert len(recent["events"]) == 40
+    with MockEonetServer(
+        event_count=40, categories=["floods", "snow"], span_days=5, seed=3
+    ) as server:
+        assert [event["geometry"][0]["coordinates"] for event in data["events"]] == [
+            event["geometry"][0]["coordinates"] for event in server.events
+        ]
@@ -1,10 +1,12 @@
+from exporters import read_bbox
 from natural_events_tracker import (
-    MAIN_URL,
     GetDataError,
     Event,
     EventTracker,
     TooManyCatError,
 )
+from matplotlib import pyplot as plt
+import gc
 import pytest
 
 
@@ -31,17 +33,17 @@ def test_event_attribute_setters():
     assert event.value == [3.0, 5.0]
 
 
-def test_get_events():
-    event_tracker = EventTracker()
+def test_get_events(eonet_url):
+    event_tracker = EventTracker(url=eonet_url)
     events = event_tracker.get_events()
     assert all(isinstance(event, Event) for event in events)
-    event_tracker = EventTracker(days=30)
+    event_tracker = EventTracker(days=30, url=eonet_url)
     events = event_tracker.get_events()
     assert all(isinstance(event, Event) for event in events)
 
 
-def test_get_classified_events():
-    event_tracker = EventTracker()
+def test_get_classified_events(eonet_url):
+    event_tracker = EventTracker(url=eonet_url)
     classified_events = event_tracker.get_classified_events()
     for category, events in classified_events.items():
         assert len(events) == sum(
@@ -49,56 +51,101 @@ def test_get_classified_events():
         )
 
 
-def test_get_data():
-    et = EventTracker()
-    assert isinstance(et.get_data(MAIN_URL), dict)
+def test_get_data(eonet_url):
+    et = EventTracker(url=eonet_url)
+    assert isinstance(et.get_data(eonet_url), dict)
     with pytest.raises(GetDataError):
         et.get_data("wrong_url")
 
 
-def test_create_events():
-    event_tracker = EventTracker()
-    data = event_tracker.get_data(MAIN_URL)
+def test_create_events(eonet_url):
+    event_tracker = EventTracker(url=eonet_url)
+    data = event_tracker.get_data(eonet_url)
     assert isinstance(event_tracker.create_events(data["events"]), list)
     assert isinstance(event_tracker.create_events(data["events"])[0], Event)
 
 
-def test_get_classified_events_empty():
-    event_tracker = EventTracker()
+def test_get_classified_events_empty(eonet_url):
+    event_tracker = EventTracker(url=eonet_url)
     event_tracker.events = []
     assert event_tracker.get_classified_events() == {}
 
 
-def test_classified_events_categories():
-    event_tracker = EventTracker()
+def test_classified_events_categories(eonet_url):
+    event_tracker = EventTracker(url=eonet_url)
     unique_categories = set([event.category for event in event_tracker.events])
     assert len(unique_categories) == len(event_tracker.classified_events)
 
 
-def test_classified_events_events_per_category():
-    event_tracker = EventTracker()
+def test_classified_events_events_per_category(eonet_url):
+    event_tracker = EventTracker(url=eonet_url)
     for category, events in event_tracker.classified_events.items():
         assert len(
             [event for event in event_tracker.events if event.category == category]
         ) == len(events)
 
 
-def test_get_classified_events_raises_error_too_many_cat():
-    event_tracker = EventTracker()
+def test_get_classified_events_raises_error_too_many_cat(eonet_url):
+    event_tracker = EventTracker(url=eonet_url)
     event_tracker.events = [Event(str(i), [], [], []) for i in range(9)]
     with pytest.raises(TooManyCatError):
         event_tracker.get_classified_events()
 
 
-def test_normalise_events_values_returns_correct_output():
-    event_tracker = EventTracker()
+def test_normalise_events_values_returns_correct_output(eonet_url):
+    event_tracker = EventTracker(url=eonet_url)
     values = [1, 2, 3, None, 5]
     new_values = event_tracker.normalise_events_values(values)
     assert len(new_values) == len(values)
     assert all(20 <= value <= 420 for value in new_values)
 
 
-def test_calc_dist_returns_correct_output():
-    event_tracker = EventTracker()
+def test_calc_dist_returns_correct_output(eonet_url):
+    event_tracker = EventTracker(url=eonet_url)
     x1, y1, x2, y2 = 5, 5, 1, 2
     assert event_tracker.calc_dist(x1, y1, x2, y2) == 5
+
+
+def test_export_events_and_coords(eonet_url, tmp_path):
+    event_tracker = EventTracker(url=eonet_url)
+    points = sum(len(event.x) for event in event_tracker.events)
+    assert event_tracker.export_events(str(tmp_path / "events.fgb")) == points
+    exported = read_bbox(str(tmp_path / "events.fgb"), (-180, -90, 180, 90))
+    assert set(exported["id"]) == {event.id for event in event_tracker.events}
+    assert all(event.id.startswith("EONET_") for event in event_tracker.events)
+    checked_params = [True for _ in event_tracker.classified_events]
+    coords = event_tracker.get_coords(checked_params, False)
+    assert event_tracker.export_coords(coords, str(tmp_path / "coords.geojsonl")) == points
+
+
+def test_get_coords_simplified(eonet_url):
+    event_tracker = EventTracker(url=eonet_url)
+    checked_params = [True for _ in event_tracker.classified_events]
+    full = event_tracker.get_coords(checked_params, False)
+    limited = event_tracker.get_coords(checked_params, False, max_points=50)
+    assert limited.keys() == full.keys()
+    assert sum(len(coords["x"]) for coords in limited.values()) <= 50
+    assert all(
+        len(coords["x"]) == len(coords["y"]) == len(coords["value"])
+        for coords in limited.values()
+    )
+    simplified = event_tracker.get_coords(checked_params, False, tolerance=1000)
+    events = sum(len(events) for events in event_tracker.classified_events.values())
+    assert sum(len(coords["x"]) for coords in simplified.values()) <= 2 * events
+
+
+def test_interactive_map_keeps_culling_without_tracker(eonet_url):
+    event_tracker = EventTracker(days=30, url=eonet_url)
+    checked_params = [True for _ in event_tracker.classified_events]
+    coords = event_tracker.get_coords(checked_params, False)
+    event_tracker.create_map(coords, interactive=True)
+    ax = plt.gca()
+    del event_tracker
+    gc.collect()
+    ax.set_xlim(0, 1)
+    ax.set_ylim(0, 1)
+    plotter = ax.figure.viewport_plotter
+    for callback, args, kwargs in plotter.timer.callbacks:
+        callback(*args, **kwargs)
+    assert all(len(scatter.get_offsets()) == 0 for scatter in plotter.scatters.values())
+    plt.close("all")
@@ -0,0 +1,55 @@
+from natural_events_tracker import Event
+from track_simplification import (
+    aggregate_values,
+    simplify_event,
+    simplify_events,
+    track_importance,
+)
+
+
+def test_track_importance_keeps_endpoints_and_corner():
+    importance = track_importance([0, 1, 2, 2, 2], [0, 0, 0, 1, 2])
+    assert importance[0] == importance[4] == float("inf")
+    assert importance[2] > importance[1]
+    assert importance[2] > importance[3]
+
+
+def test_aggregate_values_keeps_peaks():
+    values = [1, 5, None, 2, None]
+    assert aggregate_values(values, [0, 3, 4]) == [5, 2, None]
+
+
+def test_simplify_event_straight_line():
+    event = Event("seaLakeIce", [0, 1, 2, 3], [0, 0, 0, 0], [1, 7, 3, 2])
+    simplified = simplify_event(event, track_importance(event.x, event.y), 0.5)
+    assert simplified.category == "seaLakeIce"
+    assert simplified.x == [0, 3]
+    assert simplified.y == [0, 0]
+    assert simplified.value == [7, 2]
+    assert event.x == [0, 1, 2, 3]
+
+
+def test_simplify_events_point_budget():
+    events = [
+        Event("severeStorms", [0, 1, 2, 3, 4, 5], [0, 3, 0, 2, 0, 1], [None] * 6),
+        Event("severeStorms", [10, 11, 12], [0, 1, 0], [1, 2, 3]),
+    ]
+    simplified = simplify_events(events, max_points=6)
+    assert sum(len(event.x) for event in simplified) <= 6
+    assert all(event.x[0] == orig.x[0] for event, orig in zip(simplified, events))
+    assert all(event.x[-1] == orig.x[-1] for event, orig in zip(simplified, events))
+    assert simplify_events(events, max_points=100)[0].x == events[0].x
+
+
+def test_simplify_events_budget_below_endpoints():
+    events = [
+        Event("wildfires", [i, i + 0.1, i + 5], [0, 1, 0], [1, 9, 2])
+        for i in range(0, 100, 10)
+    ] + [Event("volcanoes", [50], [50], [None])]
+    for max_points in [15, 8, 3, 2]:
+        simplified = simplify_events(events, max_points=max_points)
+        assert sum(len(event.x) for event in simplified) <= max_points
+        assert {event.category for event in simplified} == {"wildfires", "volcanoes"}
+    merged = simplify_events(events, max_points=2)
+    wildfires = [event for event in merged if event.category == "wildfires"]
+    assert wildfires[0].value == [9]
@@ -0,0 +1,63 @@
+import gc
+from matplotlib import pyplot as plt
+from viewport import MultiResolutionIndex, ViewportPlotter
+import pytest
+
+
+def test_index_aggregates_points_in_cells():
+    index = MultiResolutionIndex([0.1, 0.2, 5.1], [0.1, 0.3, 5.1], [20, 50, 30], [1])
+    x, y, value = index.levels[1]
+    assert len(x) == 2
+    assert sorted(value) == [30, 50]
+    assert min(x) == pytest.approx(0.15)
+
+
+def test_index_chooses_level_by_viewport_width():
+    index = MultiResolutionIndex([], [], [])
+    assert index.choose_level(360) == 1
+    assert index.choose_level(10) is None
+    assert index.choose_level(10000) == 8
+
+
+def test_index_query_culls_points_outside_viewport():
+    index = MultiResolutionIndex([-100, 10, 20, 150], [0, 5, 6, 0], [1, 2, 3, 4])
+    x, y, value = index.query((0, 30), (0, 10))
+    assert list(x) == [10, 20]
+    assert list(value) == [2, 3]
+
+
+def test_viewport_plotter_updates_points_on_zoom():
+    fig, ax = plt.subplots()
+    ax.set_xlim(-180, 180)
+    ax.set_ylim(-90, 90)
+    coords = {"wildfires": {"x": [10, 10.1, 50], "y": [10, 10.1, 50], "value": [1] * 3}}
+    plotter = ViewportPlotter(ax, coords, ["red"])
+    assert len(plotter.scatters["wildfires"].get_offsets()) == 2
+    ax.set_xlim(9, 11)
+    ax.set_ylim(9, 11)
+    plotter.redraw()
+    assert len(plotter.scatters["wildfires"].get_offsets()) == 2
+    ax.set_xlim(10.05, 11)
+    plotter.redraw()
+    assert len(plotter.scatters["wildfires"].get_offsets()) == 1
+    plt.close(fig)
+
+
+def fire_timer(timer):
+    for callback, args, kwargs in timer.callbacks:
+        callback(*args, **kwargs)
+
+
+def test_viewport_plotter_lives_as_long_as_figure():
+    fig, ax = plt.subplots()
+    ax.set_xlim(-180, 180)
+    ax.set_ylim(-90, 90)
+    coords = {"wildfires": {"x": [10, 10.1, 50], "y": [10, 10.1, 50], "value": [1] * 3}}
+    ViewportPlotter(ax, coords, ["red"])
+    gc.collect()
+    assert len(ax.callbacks.callbacks["xlim_changed"]) == 1
+    ax.set_xlim(10.05, 11)
+    ax.set_ylim(9, 11)
+    fire_timer(fig.viewport_plotter.timer)
+    assert len(ax.collections[-1].get_offsets()) == 1
+    plt.close(fig)
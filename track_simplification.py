@@ -0,0 +1,203 @@
+import copy
+import math
+
+
+"""
+Const variables:
+importance of track endpoints, they are removed only by collapsing events,
+and the smallest grid cell size (in degrees) used for merging events
+"""
+ENDPOINT_IMPORTANCE = float("inf")
+MERGE_CELL = 1
+
+
+def segment_dist(x, y, x_start, y_start, x_end, y_end):
+    """
+    Returns 2D distance between point and segment given by its ends
+    """
+    dx = x_end - x_start
+    dy = y_end - y_start
+    length = dx**2 + dy**2
+    if length == 0:
+        return ((x - x_start) ** 2 + (y - y_start) ** 2) ** 0.5
+    t = ((x - x_start) * dx + (y - y_start) * dy) / length
+    t = max(0, min(1, t))
+    proj_x = x_start + t * dx
+    proj_y = y_start + t * dy
+    return ((x - proj_x) ** 2 + (y - proj_y) ** 2) ** 0.5
+
+
+def track_importance(x_coords, y_coords):
+    """
+    Takes as parameters coordinates of single event track.
+    Runs Douglas-Peucker algorithm without tolerance and for each point
+    remembers distance for which it was chosen. Distance of a point is never
+    bigger than distance of segment which contains it, so point is kept by
+    Douglas-Peucker with tolerance t exactly when its importance is above t.
+    It returns list of points importances
+    """
+    count = len(x_coords)
+    importance = [0.0 for _ in range(count)]
+    if count == 0:
+        return importance
+    importance[0] = ENDPOINT_IMPORTANCE
+    importance[count - 1] = ENDPOINT_IMPORTANCE
+    stack = [(0, count - 1, ENDPOINT_IMPORTANCE)]
+    while stack:
+        start, end, parent = stack.pop()
+        if end - start < 2:
+            continue
+        max_dist, max_index = -1, start + 1
+        for i in range(start + 1, end):
+            distance = segment_dist(
+                x_coords[i],
+                y_coords[i],
+                x_coords[start],
+                y_coords[start],
+                x_coords[end],
+                y_coords[end],
+            )
+            if distance > max_dist:
+                max_dist, max_index = distance, i
+        importance[max_index] = min(max_dist, parent)
+        stack.append((start, max_index, importance[max_index]))
+        stack.append((max_index, end, importance[max_index]))
+    return importance
+
+
+def aggregate_values(values, kept):
+    """
+    Takes as parameters event's values and sorted indices of kept points.
+    Every removed point is merged with last kept point before it, kept point
+    gets the biggest not null value of merged points so peaks of magnitude
+    are not lost.
+    It returns list of values of kept points
+    """
+    new_values = []
+    for k, start in enumerate(kept):
+        end = kept[k + 1] if k + 1 < len(kept) else len(values)
+        merged = [value for value in values[start:end] if value is not None]
+        new_values.append(max(merged) if merged else None)
+    return new_values
+
+
+def simplify_event(event, importance, tolerance):
+    """
+    Takes as parameters Event, importances of its points and tolerance.
+    It returns new Event with endpoints and points which
+    importance is above tolerance
+    """
+    kept = [
+        i
+        for i, imp in enumerate(importance)
+        if imp == ENDPOINT_IMPORTANCE or imp > tolerance
+    ]
+    simplified = copy.copy(event)
+    simplified.x = [event.x[i] for i in kept]
+    simplified.y = [event.y[i] for i in kept]
+    simplified.value = aggregate_values(event.value, kept)
+    return simplified
+
+
+def budget_tolerance(importances, max_points):
+    """
+    Takes as parameters importances lists of all events and maximal
+    number of points. It returns the smallest tolerance for which
+    at most max_points points are kept. Endpoints are always kept,
+    so when there are more of them than max_points they are the result
+    """
+    all_importance = sorted(
+        (imp for importance in importances for imp in importance), reverse=True
+    )
+    if len(all_importance) <= max_points:
+        return -1
+    return all_importance[max(max_points, 0)]
+
+
+def merge_events(events):
+    """
+    Takes as parameter not empty list of Events of one category
+    and returns single point Event with average position of their
+    points and the biggest not null value
+    """
+    x = [x for event in events for x in event.x]
+    y = [y for event in events for y in event.y]
+    values = [value for event in events for value in event.value]
+    merged = copy.copy(events[0])
+    merged.x = [sum(x) / len(x)]
+    merged.y = [sum(y) / len(y)]
+    merged.value = aggregate_values(values, [0])
+    return merged
+
+
+def track_extent(event):
+    """
+    Returns sum of width and height of event's track
+    """
+    return max(event.x) - min(event.x) + max(event.y) - min(event.y)
+
+
+def fit_endpoints(events, max_points):
+    """
+    Takes as parameters list of Events and maximal number of points.
+    When endpoints of tracks alone do not fit in max_points, events with
+    the shortest tracks are collapsed to single points. If it is still
+    too many, single points of the same category are merged in grid cells
+    which are doubled until points fit or there is one point per category.
+    It returns list of Events
+    """
+    endpoints = sum(min(len(event.x), 2) for event in events)
+    if endpoints <= max_points:
+        return events
+
+    events = list(events)
+    long_events = [i for i, event in enumerate(events) if len(event.x) > 1]
+    long_events.sort(key=lambda i: track_extent(events[i]))
+    for i in long_events:
+        if endpoints <= max_points:
+            return events
+        events[i] = merge_events([events[i]])
+        endpoints -= 1
+
+    cell = MERGE_CELL
+    while endpoints > max_points:
+        cells = {}
+        for event in events:
+            if not event.x:
+                continue
+            key = (
+                event.category,
+                math.floor((event.x[0] + 180) / cell),
+                math.floor((event.y[0] + 90) / cell),
+            )
+            cells.setdefault(key, []).append(event)
+        events = [merge_events(group) for group in cells.values()]
+        endpoints = len(events)
+        if cell > 360:
+            break
+        cell *= 2
+    return events
+
+
+def simplify_events(events, tolerance=None, max_points=None):
+    """
+    Takes as parameters list of Events, tolerance in degrees and
+    maximal number of points for all events together.
+    Simplifies each event track using Douglas-Peucker algorithm with
+    given tolerance or with tolerance which fits in max_points
+    (the stricter one is used if both are given). If endpoints do not fit
+    in max_points events are collapsed and merged by fit_endpoints, so
+    returned list can be shorter. Result has at most max_points points
+    unless it is smaller than number of categories.
+    It returns list of new Events
+    """
+    if max_points is not None:
+        events = fit_endpoints(events, max_points)
+    importances = [track_importance(event.x, event.y) for event in events]
+    limit = -1 if tolerance is None else tolerance
+    if max_points is not None:
+        limit = max(limit, budget_tolerance(importances, max_points))
+    return [
+        simplify_event(event, importance, limit)
+        for event, importance in zip(events, importances)
+    ]
@@ -0,0 +1,156 @@
+import numpy as np
+
+
+"""
+Const variables:
+sizes of grid cells (in degrees) for aggregated levels, number of cells
+which should fit in viewport width and time (ms) of redraw debounce
+"""
+CELL_SIZES = [0.25, 0.5, 1, 2, 4, 8]
+LOD_RESOLUTION = 200
+DEBOUNCE_MS = 100
+
+
+class MultiResolutionIndex:
+    """
+    A class to represent points of single category at many levels of detail
+
+    Attributes
+    ----------
+    levels : dict
+        contains for each cell size (and None for individual points)
+        tuple of numpy arrays: x-coords, y-coords and point-values
+    """
+
+    def __init__(self, x_coords, y_coords, values, cell_sizes=CELL_SIZES):
+        """
+        Constructs all the necessary attributes objects by calling methods.
+        """
+        x = np.asarray(x_coords, dtype=float)
+        y = np.asarray(y_coords, dtype=float)
+        value = np.asarray(values, dtype=float)
+        self.cell_sizes = sorted(cell_sizes)
+        self.levels = {None: (x, y, value)}
+        for cell_size in self.cell_sizes:
+            self.levels[cell_size] = self.aggregate(x, y, value, cell_size)
+
+    def aggregate(self, x, y, value, cell_size):
+        """
+        Takes as parameters arrays of points features and size of grid cell.
+        Method puts points in grid cells and creates for each cell new point
+        which has average position of points in it and their maximal value.
+        It returns 3 arrays which represents new points
+        """
+        if len(x) == 0:
+            return x, y, value
+        cells = np.stack(
+            [np.floor(x / cell_size), np.floor(y / cell_size)], axis=1
+        )
+        _, inverse = np.unique(cells, axis=0, return_inverse=True)
+        inverse = inverse.ravel()
+        counts = np.bincount(inverse)
+        new_x = np.bincount(inverse, weights=x) / counts
+        new_y = np.bincount(inverse, weights=y) / counts
+        new_value = np.full(len(counts), -np.inf)
+        np.maximum.at(new_value, inverse, value)
+        return new_x, new_y, new_value
+
+    def choose_level(self, width):
+        """
+        Takes as parameter width of viewport and returns the biggest cell size
+        which is not bigger than width / LOD_RESOLUTION
+        or None if individual points should be used
+        """
+        target = width / LOD_RESOLUTION
+        level = None
+        for cell_size in self.cell_sizes:
+            if cell_size <= target:
+                level = cell_size
+        return level
+
+    def query(self, xlim, ylim):
+        """
+        Takes as parameters viewport limits, chooses level of detail
+        and returns 3 arrays of points which are in the viewport
+        """
+        x0, x1 = sorted(xlim)
+        y0, y1 = sorted(ylim)
+        x, y, value = self.levels[self.choose_level(x1 - x0)]
+        inside = (x >= x0) & (x <= x1) & (y >= y0) & (y <= y1)
+        return x[inside], y[inside], value[inside]
+
+
+class ViewportPlotter:
+    """
+    A class to represent interactive plot which draws only points inside
+    current axis limits, using MultiResolutionIndex for each category
+
+    Attributes
+    ----------
+    ax :
+        matplotlib axis with the map
+    indexes :
+        contains dictonary of MultiResolutionIndex based on category
+    scatters :
+        contains dictonary of scatter collections based on category
+
+    Plotter is stored as viewport_plotter attribute of the figure, because
+    axis callbacks keep only weak references to its methods, so it has to
+    live as long as the figure and not as long as object which created it
+    """
+
+    def __init__(self, ax, all_coords, colors, debounce=DEBOUNCE_MS):
+        """
+        Constructs indexes, adds scatter for each category and
+        connects redraw to axis limits changes
+        """
+        self.ax = ax
+        self.indexes = {}
+        self.scatters = {}
+        for i, (category_name, category) in enumerate(all_coords.items()):
+            self.indexes[category_name] = MultiResolutionIndex(
+                category["x"], category["y"], category["value"]
+            )
+            self.scatters[category_name] = ax.scatter(
+                [],
+                [],
+                marker="o",
+                color=colors[i],
+                alpha=1.0,
+                label=category_name,
+            )
+        self.update_points()
+
+        self.timer = ax.figure.canvas.new_timer(interval=debounce)
+        self.timer.single_shot = True
+        self.timer.add_callback(self.redraw)
+        ax.callbacks.connect("xlim_changed", self.on_limits_changed)
+        ax.callbacks.connect("ylim_changed", self.on_limits_changed)
+        ax.figure.viewport_plotter = self
+
+    def on_limits_changed(self, ax):
+        """
+        Restarts debounce timer, so points are redrawn
+        only when limits stop changing
+        """
+        self.timer.stop()
+        self.timer.start()
+
+    def update_points(self):
+        """
+        Sets points of every scatter to points inside current viewport
+        """
+        xlim = self.ax.get_xlim()
+        ylim = self.ax.get_ylim()
+        for category_name, index in self.indexes.items():
+            x, y, value = index.query(xlim, ylim)
+            scatter = self.scatters[category_name]
+            scatter.set_offsets(np.column_stack([x, y]))
+            scatter.set_sizes(value)
+
+    def redraw(self):
+        """
+        Updates points and requests redrawing of the canvas
+        """
+        self.update_points()
+        self.ax.figure.canvas.draw_idle()